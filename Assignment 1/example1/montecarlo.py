@@ -1,7 +1,19 @@
+import numpy as np
+
 from random import random
 from rectangle import Rectangle
 from typing import List
 
+try:
+    from montecarlo_numba import area_kernel
+except ImportError:  # numba is not installed; stick to the NumPy version
+    area_kernel = None
+
+try:
+    from scipy.stats import qmc
+except ImportError:  # scipy is not installed; only the "mc" engine is available
+    qmc = None
+
 
 class MonteCarlo:
     def __init__(self, length: int, width: int, rectangles: List[Rectangle]):
@@ -14,37 +26,110 @@ class MonteCarlo:
         """
         self.length = length
         self.width = width
-        self.rectangles = rectangles
-
-    def area(self, num_of_shots: int):
+        # biggest rectangles first: a shot is most likely to land in a big
+        # rectangle, so the early-exit scans in area() break after 1-2 checks
+        self.rectangles = sorted(rectangles, key=lambda r: -r.length * r.width)
+        rectangles = self.rectangles
+
+        # Struct-of-Arrays layout: the four edge coordinates of the embedded
+        # rectangles, computed once so the hot paths never have to touch the
+        # Rectangle objects again
+        self._x0 = np.fromiter((r.origin_x for r in rectangles), dtype=np.float64)
+        self._x1 = self._x0 + np.fromiter((r.length for r in rectangles), dtype=np.float64)
+        self._y0 = np.fromiter((r.origin_y for r in rectangles), dtype=np.float64)
+        self._y1 = self._y0 + np.fromiter((r.width for r in rectangles), dtype=np.float64)
+
+    def area(self, num_of_shots: int, engine: str = "mc"):
         """Method to estimate the area of the enclosing rectangle that is not covered by the embedded rectangles
 
         Keyword arguments:
         :param num_of_shots -- Number of generated random points whose location (inside/outside) is analyzed
+        :param engine -- "mc" for pseudo-random shots (error ~ O(N^-1/2)), "qmc" for a
+        scrambled Sobol sequence (error ~ O(N^-1); prefer a power of two for num_of_shots)
         :return float -- the area of the enclosing rectangle not covered.
-        :raises ValueError if any of the parameters is None
+        :raises ValueError if any of the parameters is None or engine is unknown
         """
         if num_of_shots is None:
             raise ValueError("num_of_shots is None!")
+        if engine not in ("mc", "qmc"):
+            raise ValueError(f"Unknown engine: {engine}!")
 
-        hits = 0  # number of hits in embedded rectangles
         total_area = self.width * self.length
-        for shot in range(num_of_shots):
+
+        if not self.rectangles:  # no embedded rectangles --> no hits
+            return float(total_area)
+
+        if engine == "mc" and num_of_shots <= 512:
+            # array/kernel setup dominates for a handful of shots;
+            # the plain Python loop is faster here
+            return self._area_scalar(num_of_shots)
+
+        if engine == "qmc":
+            if qmc is None:
+                raise ImportError("scipy is required for the qmc engine!")
+            # low-discrepancy shots cover the rectangle far more evenly than
+            # pseudo-random ones, so the estimate converges with fewer shots
+            points = qmc.Sobol(d=2, scramble=True).random(num_of_shots)
+        elif area_kernel is not None:
+            # compiled kernel: keeps the early-exit inner loop, O(1) extra memory,
+            # and samples the shots on all cores
+            hits = int(
+                area_kernel(
+                    float(self.length),
+                    float(self.width),
+                    self._x0,
+                    self._x1,
+                    self._y0,
+                    self._y1,
+                    num_of_shots,
+                )
+            )
+            return total_area * (1 - hits / num_of_shots)
+        else:
+            # draw all shots at once instead of one pair of coordinates per loop pass
+            points = np.random.default_rng().random((num_of_shots, 2))
+
+        points[:, 0] *= self.length
+        points[:, 1] *= self.width
+
+        # check every point against every rectangle in four vectorized passes;
+        # a point hits if it is inside at least one rectangle
+        is_inside = (
+            (points[:, 0:1] >= self._x0)
+            & (points[:, 0:1] <= self._x1)
+            & (points[:, 1:2] >= self._y0)
+            & (points[:, 1:2] <= self._y1)
+        ).any(axis=1)
+        hits = int(is_inside.sum())  # number of hits in embedded rectangles
+        return total_area * (1 - hits / num_of_shots)
+
+    def _area_scalar(self, num_of_shots: int) -> float:
+        """Per-shot Python loop, used for small shot counts.
+
+        Keyword arguments:
+        :param num_of_shots -- Number of generated random points
+        :return float -- the area of the enclosing rectangle not covered.
+        """
+        # bind everything the loop touches to locals once; global and
+        # attribute lookups per iteration are pure interpreter overhead
+        _rand = random
+        _length = self.length
+        _width = self.width
+        _rects = self.rectangles
+        _inside = MonteCarlo.inside
+
+        hits = 0  # number of hits in embedded rectangles
+        for _ in range(num_of_shots):
             # get point with random coordinates
-            r_x = random()
-            r_y = random()
-            rnd = (r_x * self.length, r_y * self.width)
+            x = _rand() * _length
+            y = _rand() * _width
 
             # check if point is in any rectangle
-            is_inside = False
-            for rectangle in self.rectangles:
-                is_inside = self.inside(x=rnd[0], y=rnd[1], rect=rectangle)
-                if is_inside:  # point is in some rectangle
+            for rectangle in _rects:
+                if _inside(x, y, rectangle):  # point is in some rectangle
+                    hits += 1
                     break
-
-            if is_inside:
-                hits += 1
-        return total_area * (1 - hits / num_of_shots)
+        return _length * _width * (1 - hits / num_of_shots)
 
     @staticmethod
     def inside(x: float, y: float, rect: Rectangle):
@@ -60,18 +145,16 @@ class MonteCarlo:
         if x is None or y is None:
             raise ValueError("One of x, y is None!")
 
-        # get corners for intuition. Not needed, but helpful.
-        left_bottom = (rect.origin_x, rect.origin_y)
-        right_bottom = (rect.origin_x + rect.length, rect.origin_y)
-        left_top = (rect.origin_x, rect.origin_y + rect.width)
-        right_top = (rect.origin_x + rect.length, rect.origin_y + rect.width)
+        # signed distances of the point to the four rectangle edges;
+        # all non-negative <=> point is inside (borders included)
+        dx1 = x - rect.origin_x
+        dx2 = rect.origin_x + rect.length - x
+        dy1 = y - rect.origin_y
+        dy2 = rect.origin_y + rect.width - y
 
-        # check if point is inside rectangle: first in x-range, then in y-range
-        if left_bottom[0] <= x <= right_bottom[0]:
-            if right_bottom[1] <= y <= right_top[1]:
-                return True
-        else:
-            return False
+        # bitwise & instead of short-circuit `and`: no branches, and the same
+        # expression works elementwise on whole coordinate arrays
+        return (dx1 >= 0) & (dx2 >= 0) & (dy1 >= 0) & (dy2 >= 0)
 
 
 def main():
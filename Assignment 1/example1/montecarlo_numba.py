@@ -0,0 +1,30 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def area_kernel(length, width, x0, x1, y0, y1, num_of_shots):
+    """Count how many random shots land inside at least one embedded rectangle.
+
+    Keyword arguments:
+    :param length -- length of the enclosing rectangle
+    :param width -- width of the enclosing rectangle
+    :param x0 -- left edges of the embedded rectangles (one entry each)
+    :param x1 -- right edges of the embedded rectangles
+    :param y0 -- bottom edges of the embedded rectangles
+    :param y1 -- top edges of the embedded rectangles
+    :param num_of_shots -- number of random points to generate
+    :return int -- number of hits in embedded rectangles
+    """
+    hits = 0
+    for i in prange(num_of_shots):
+        # get point with random coordinates
+        x = np.random.random() * length
+        y = np.random.random() * width
+
+        # check if point is in any rectangle; stop at the first hit
+        for j in range(x0.shape[0]):
+            if x0[j] <= x <= x1[j] and y0[j] <= y <= y1[j]:
+                hits += 1
+                break
+    return hits
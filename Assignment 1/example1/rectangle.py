@@ -1,5 +1,7 @@
 class Rectangle():
 
+    __slots__ = ("origin_x", "origin_y", "length", "width")
+
     def __init__(self, origin_x, origin_y, length, width):
         self.origin_x = origin_x
         self.origin_y = origin_y
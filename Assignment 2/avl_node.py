@@ -9,6 +9,10 @@ class AVLNode:
     A node in the AVL tree.
     """
 
+    # fixed attribute slots instead of a per-node __dict__: smaller nodes and
+    # C-level attribute access in the traversal/rebalance hot paths
+    __slots__ = ("key", "value", "parent", "left", "right", "height", "bf")
+
     def __init__(self, key: Union[int, float] = 0, value: Any = None):
         """
         Create a new node.
@@ -21,6 +25,7 @@ class AVLNode:
         self.left = None
         self.right = None
         self.height = 0
+        self.bf = 0  # cached balance factor: height(left) - height(right)
 
     def to_string(self):
         """
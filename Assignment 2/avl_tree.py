@@ -1,11 +1,94 @@
 """Implements an AVL tree."""
 
-from collections import defaultdict
-from copy import deepcopy
 from typing import Any, Generator, Iterator, Tuple, Union
 
+import numpy as np
+
 from avl_node import AVLNode
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is not installed; bulk_find falls back to Python
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _bulk_find(query, keys, left, right):
+        """Descend the frozen tree arrays for every query key in parallel.
+
+        :param query: keys to look up (float64 array)
+        :param keys: node keys in BFS order (float64 array)
+        :param left: index of each node's left child, -1 for None (int32 array)
+        :param right: index of each node's right child, -1 for None (int32 array)
+        :return: array of node indices, -1 where a key was not found
+        """
+        out = np.empty(query.size, dtype=np.int64)
+        root = 0 if keys.size > 0 else -1
+        for i in prange(query.size):
+            key = query[i]
+            node = root
+            result = -1
+            while node != -1:
+                node_key = keys[node]
+                if key < node_key:
+                    node = left[node]
+                elif key > node_key:
+                    node = right[node]
+                else:  # equality --> key found
+                    result = node
+                    break
+            out[i] = result
+        return out
+
+else:
+    _bulk_find = None
+
+
+# traversals as module-level generators: the methods hand the root over and
+# no function object or closure cell is rebuilt per call
+def _inorder_iter(node: AVLNode) -> Generator[AVLNode, None, None]:
+    """Yield nodes in inorder (left, root, right) without recursion."""
+    current = node
+    stack = []
+    while current or stack:
+        while current:  # descend to the leftmost unvisited node
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        yield current
+        current = current.right
+
+
+def _preorder_iter(node: AVLNode) -> Generator[AVLNode, None, None]:
+    """Yield nodes in preorder (root, left, right) without recursion."""
+    # push right before left so left is popped first
+    stack = [node] if node else []
+    while stack:
+        current = stack.pop()
+        yield current
+        if current.right:
+            stack.append(current.right)
+        if current.left:
+            stack.append(current.left)
+
+
+def _postorder_iter(node: AVLNode) -> Generator[AVLNode, None, None]:
+    """Yield nodes in postorder (left, right, root) without recursion."""
+    # a node is yielded on its second visit
+    stack = [(node, False)] if node else []
+    while stack:
+        current, visited = stack.pop()
+        if visited:
+            yield current
+        else:
+            stack.append((current, True))
+            if current.right:
+                stack.append((current.right, False))
+            if current.left:
+                stack.append((current.left, False))
+
 
 class AVLTree:
     """AVL Tree implementation."""
@@ -14,6 +97,7 @@ class AVLTree:
         """Default constructor. Initializes the AVL tree."""
         self.root = None
         self.size = 0
+        self._frozen = None  # cached flat-array snapshot for bulk_find
 
     def get_tree_root(self) -> Union[None, AVLNode]:
         """
@@ -40,10 +124,8 @@ class AVLTree:
         """Yields an array representation of the tree's values (pre-order).
         :return Array representation of the tree values.
         """
-        array = list(self.preorder())
-        for i, value in enumerate(array):  # only return key values, not entire node
-            array[i] = value.value
-        return array
+        # only return the values, not the entire nodes; one pass, no rewrite
+        return [node.value for node in self.preorder()]
 
     def update_heights(self, node: AVLNode) -> None:
         """Updates the heights of all nodes in the tree."""
@@ -62,17 +144,67 @@ class AVLTree:
         :raises ValueError if the key is None
         """
         current = self.root
-        while current:
-            if key < current.key:
+        while current is not None:
+            current_key = current.key  # fetch the key once per node
+            if key < current_key:
                 current = current.left
-            elif key > current.key:
+            elif key > current_key:
                 current = current.right
             else:  # equality --> key found
                 if _return_node:
                     return current
-                return current.key
+                return current_key
         return None
 
+    def freeze(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, list]:
+        """Snapshots the tree into flat arrays (Struct-of-Arrays, BFS order).
+        The snapshot is cached and invalidated by insert/remove_by_key.
+        :return Tuple of (keys, left child indices, right child indices,
+        values); child index -1 stands for None.
+        """
+        if self._frozen is None:
+            nodes = []
+            if self.root is not None:  # BFS assigns each node its array index
+                nodes.append(self.root)
+                for node in nodes:
+                    if node.left is not None:
+                        nodes.append(node.left)
+                    if node.right is not None:
+                        nodes.append(node.right)
+
+            keys = np.empty(len(nodes), dtype=np.float64)
+            left = np.full(len(nodes), -1, dtype=np.int32)
+            right = np.full(len(nodes), -1, dtype=np.int32)
+            values = [node.value for node in nodes]
+            index = {id(node): i for i, node in enumerate(nodes)}
+            for i, node in enumerate(nodes):
+                keys[i] = node.key
+                if node.left is not None:
+                    left[i] = index[id(node.left)]
+                if node.right is not None:
+                    right[i] = index[id(node.right)]
+            self._frozen = (keys, left, right, values)
+        return self._frozen
+
+    def bulk_find(self, keys) -> np.ndarray:
+        """Looks up many keys at once against the frozen snapshot.
+        :param keys: Keys to search (any array-like of numbers).
+        :return Array with the key at each position where it was found,
+        np.nan otherwise (batched counterpart of find_by_key).
+        """
+        keys_arr, left_idx, right_idx, _ = self.freeze()
+        query = np.asarray(keys, dtype=np.float64)
+
+        if _bulk_find is not None:
+            found = _bulk_find(query, keys_arr, left_idx, right_idx) >= 0
+        else:  # no numba --> one iterative descent per key
+            found = np.fromiter(
+                (self.find_by_key(key) is not None for key in query.tolist()),
+                dtype=bool,
+                count=query.size,
+            )
+        return np.where(found, query, np.nan)
+
     def insert(self, key: Union[int, float], value: Any) -> bool:
         """Inserts a new node into AVL tree.
         :param key: Key of the new node.
@@ -107,13 +239,11 @@ class AVLTree:
                 parent.left = new
             else:
                 parent.right = new
-
-            # fix tree
-            # if parent had 1 child before, tree is still balanced
-            # else: rebalance the tree
-            if not (parent.left and parent.right):
-                self._cut_link_restructuring(new)
+            # fix tree: refresh heights/balance factors up to the root and
+            # rotate wherever the insert threw a subtree out of balance
+            self._rebalance(parent)
         self.size += 1
+        self._frozen = None  # tree changed, drop the snapshot
         return True
 
     def remove_by_key(self, key: int) -> bool:
@@ -132,23 +262,15 @@ class AVLTree:
         if self.size == 1:
             self.root = None
             self.size -= 1
+            self._frozen = None  # tree changed, drop the snapshot
             return True
 
         parent = node_to_remove.parent
-        key_to_remove_height = node_to_remove.height
-
-        # get balancing successor of node_to_remove
-        balance_node = None
-        if parent.left == node_to_remove:
-            balance_node = self.get_rightmost(parent)
-        elif parent.right == node_to_remove:
-            balance_node = self.get_leftmost(parent)
-
-        restructure = True
 
         # CASE 1: node has no child node
         if (not node_to_remove.right) and (not node_to_remove.left):
             self._delete_no_child(node_to_remove, parent)
+            balance_node = parent
 
         # CASE 2: node has only one child; replace it by child node
         elif (
@@ -157,16 +279,16 @@ class AVLTree:
             or (not node_to_remove.left and node_to_remove.right)
         ):
             self._delete_one_child(node_to_remove, parent)
+            balance_node = parent
 
         # CASE 3: Node has 2 child nodes
-        elif node_to_remove.left and node_to_remove.right:
-            self._delete_two_children(node_to_remove, key_to_remove_height)
-            restructure = False
+        else:
+            balance_node = self._delete_two_children(node_to_remove)
 
-        # restructure if necessary
-        if parent and balance_node and restructure:
-            self._cut_link_restructuring(balance_node)
+        # rebalance from the deepest node whose subtree changed
+        self._rebalance(balance_node)
         self.size -= 1
+        self._frozen = None  # tree changed, drop the snapshot
         return True
 
     def _change_nodes(self, deleting_node: AVLNode, replacing_node: AVLNode) -> None:
@@ -183,29 +305,30 @@ class AVLTree:
         if replacing_node is not None:  # change parent relationship
             replacing_node.parent = deleting_node.parent
 
-    def _delete_two_children(
-        self, key_to_remove: AVLNode, key_to_remove_height: int
-    ) -> None:
+    def _delete_two_children(self, key_to_remove: AVLNode) -> AVLNode:
         """
         Helper function for deleting a node with two children.
         :param key_to_remove: node to delete
-        :param key_to_remove_height: height of node to delete
-        :return: None
-        """
-        right_child = key_to_remove.right
-        next_successor = self.get_smallest_recursively(
-            right_child
-        )  # get next in-order successor of key_to_remove
+        :return: deepest node whose subtree changed (start of the rebalance)
+        """
+        # next in-order successor of key_to_remove: leftmost node of the
+        # right subtree, inlined here instead of a staticmethod call per
+        # removal (get_leftmost stays for external use)
+        next_successor = key_to_remove.right
+        while next_successor.left:
+            next_successor = next_successor.left
+        balance_node = next_successor
         if (
             next_successor.parent != key_to_remove
         ):  # make sure it is not a child of itself
+            balance_node = next_successor.parent
             self._change_nodes(next_successor, next_successor.right)  # swap them
             next_successor.right = key_to_remove.right  # change links
             next_successor.right.parent = next_successor
         self._change_nodes(key_to_remove, next_successor)  # swap them
         next_successor.left = key_to_remove.left  # change links
         next_successor.left.parent = next_successor
-        next_successor.height = key_to_remove_height
+        return balance_node
 
     @staticmethod
     def _delete_one_child(key_to_remove: AVLNode, parent: AVLNode) -> None:
@@ -218,18 +341,15 @@ class AVLTree:
         # Case 2a: child is on the left to key_to_remove
         if key_to_remove.left and not key_to_remove.right:
             child = key_to_remove.left
-            if key_to_remove.key <= parent.key:
-                parent.left = child
-            elif key_to_remove.key > parent.key:
-                parent.right = child
-
         # Case 2b: child is on the right to key_to_remove
-        elif not key_to_remove.left and key_to_remove.right:
+        else:
             child = key_to_remove.right
-            if key_to_remove.key <= parent.key:
-                parent.left = child
-            elif key_to_remove.key > parent.key:
-                parent.right = child
+
+        if key_to_remove.key <= parent.key:
+            parent.left = child
+        else:
+            parent.right = child
+        child.parent = parent  # the child moves up one level
 
     @staticmethod
     def _delete_no_child(key_to_remove: AVLNode, parent: AVLNode) -> None:
@@ -244,284 +364,98 @@ class AVLTree:
         elif key_to_remove.key > parent.key:
             parent.right = None
 
-    def _cut_link_restructuring(self, node: AVLNode) -> None:
+    def _rebalance(self, node: AVLNode) -> None:
         """
-        Performs the Cut-Link restructuring algorithm
-        :param node: node which is being affected
+        Walks from node up to the root, refreshing the cached heights and
+        balance factors and rotating wherever a subtree is out of balance.
+        :param node: deepest node whose subtree changed
         :return: None
         """
-        parent = node.parent  # equal to z in slides
-        y = node
-        x = None
-        while parent:
-            grandparent = parent.parent
-            parent.height = self._update_single_height(parent)
-            if abs(self._get_balance_factor(parent)) <= 1:
-                x = y
-                y = parent
-                parent = parent.parent
-
-            else:
-                is_x_left = bool(x == y.left)
-                is_y_left = bool(y == parent.left)
-
-                # INORDER
-                # create copies to remove unwanted children for traversal
-                parent_tmp = deepcopy(
-                    parent
-                )  # could also be done via tree traversal/copying, but this is faster
-                # (and still part of standard library)
-
-                # get relevant children of parent
-                (
-                    parent_child,
-                    x_left,
-                    x_right,
-                    x_tmp,
-                    y_child,
-                    y_tmp,
-                ) = self._get_children(is_x_left, is_y_left, parent_tmp)
-
-                # create dictionary that stores node references
-                # delete child nodes
-                child_dict = self._delete_children(
-                    parent_child, x_left, x_right, y_child
-                )
-
-                # create inorder array of z/parent, but without unnecessary children (as always ;) )
-                inorder_array = list(self.inorder(parent_tmp))
-                cut_array = (
-                    inorder_array.copy()
-                )  # again, faster and part of standard library
-
-                # insert Nones into cut_array, at proper index
-                self._insert_nones(
-                    cut_array, inorder_array, parent_tmp, x_left, x_right, x_tmp, y_tmp
-                )
-
-                # re-insert child nodes into cut_array
-                self._reinsert_children(child_dict, cut_array)
-
-                # re-insert parent node of subtree into tree
-                current_root = self._reinsert_parent(cut_array, grandparent, parent)
-
-                # re-insert x/y/children into tree
-                self._update_children(current_root, cut_array)
-
-                node = self.find_by_key(
-                    node.key, _return_node=True
-                )  # due to copy; still O(log n)
-                parent = node.parent
-                y = node
-                x = None
-
-    def _update_children(self, current_root: AVLNode, cut_array: list) -> None:
-        """
-        Updates the children of the current root according to slides, s.t. final tree is balanced
-        :param current_root: root node of unbalanced subtree
-        :param cut_array: array of nodes in inorder traversal
+        while node:
+            # one pass over the children for both height and balance factor;
+            # the factor is cached on the node so the test is one int compare
+            left, right = node.left, node.right
+            left_height = left.height if left else -1
+            right_height = right.height if right else -1
+            node.height = 1 + max(left_height, right_height)
+            node.bf = left_height - right_height
+            if node.bf > 1:  # left-heavy
+                if node.left.bf < 0:  # left-right case
+                    self._rotate_left(node.left)
+                self._rotate_right(node)
+                node = node.parent  # rotated subtree root, heights already set
+            elif node.bf < -1:  # right-heavy
+                if node.right.bf > 0:  # right-left case
+                    self._rotate_right(node.right)
+                self._rotate_left(node)
+                node = node.parent  # rotated subtree root, heights already set
+            node = node.parent
+
+    def _rotate_left(self, node: AVLNode) -> None:
+        """
+        Rotates the subtree rooted at node to the left; node's right child
+        becomes the subtree root. Heights and balance factors of the two
+        rotated nodes are refreshed in place.
+        :param node: root of the subtree to rotate
         :return: None
         """
-        current_root.left = cut_array[1]
-        current_root.right = cut_array[5]
-        # also reassign parent
-        current_root.left.parent = current_root
-        current_root.right.parent = current_root
-
-        current_root.left.height = 1 + max(
-            self.get_height(cut_array[0]),
-            self.get_height(cut_array[2]),
-        )
-        current_root.right.height = 1 + max(
-            self.get_height(cut_array[4]),
-            self.get_height(cut_array[6]),
-        )
-        current_root.height = 1 + max(
-            self.get_height(current_root.right),
-            self.get_height(current_root.left),
-        )
-
-        current_root.left.left = cut_array[0]
-        current_root.left.right = cut_array[2]
-        # update parent
-        if cut_array[0]:
-            current_root.left.right.parent = current_root.left
-
-        if cut_array[2]:
-            current_root.left.left.parent = current_root.left
-
-        current_root.right.left = cut_array[4]
-        current_root.right.right = cut_array[6]
-        # update parent
-        if cut_array[6]:
-            current_root.right.right.parent = current_root.right
-
-        if cut_array[4]:
-            current_root.right.left.parent = current_root.right
-
-    def _reinsert_parent(
-        self, cut_array: list, grandparent: AVLNode, parent: AVLNode
-    ) -> AVLNode:
-        """
-        Reinserts the parent node into the tree
-        :param cut_array: array of nodes
-        :param grandparent: grandparent node
-        :param parent: parent node
-        :return: root of new subtree
-        """
-        if parent == self.root:
-            parent = cut_array[3]
-            current_root = parent
-            self.root = current_root
-            current_root.parent = None
-        elif grandparent.left == parent:
-            parent = cut_array[3]
-            grandparent.left = parent
-            current_root = parent
-            current_root.parent = grandparent
-        elif grandparent.right == parent:
-            parent = cut_array[3]
-            grandparent.right = parent
-            current_root = parent
-            current_root.parent = grandparent
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+        pivot.parent = node.parent
+        if node.parent is None:
+            self.root = pivot
+        elif node.parent.left is node:
+            node.parent.left = pivot
         else:
-            raise Exception("Parent not found")
-        return current_root
-
-    @staticmethod
-    def _reinsert_children(child_dict: defaultdict, inorder_list: list):
-        """
-        Reinserts children of deleted node into inorder list
-        :param child_dict: dictionary of child nodes
-        :param inorder_list: list of inorder nodes, without children
+            node.parent.right = pivot
+        pivot.left = node
+        node.parent = pivot
+
+        left, right = node.left, node.right
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        node.height = 1 + max(left_height, right_height)
+        node.bf = left_height - right_height
+        left, right = pivot.left, pivot.right
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        pivot.height = 1 + max(left_height, right_height)
+        pivot.bf = left_height - right_height
+
+    def _rotate_right(self, node: AVLNode) -> None:
+        """
+        Rotates the subtree rooted at node to the right; node's left child
+        becomes the subtree root. Heights and balance factors of the two
+        rotated nodes are refreshed in place.
+        :param node: root of the subtree to rotate
         :return: None
         """
-        for value in child_dict.values():
-            if value["left"]:
-                value_in_list = [
-                    x if value["parent"].key == x.key else None for x in inorder_list
-                ]  # find value in list
-                value_in_list = list(filter(None, value_in_list))[0]
-                value_in_list.left = value["left"]
-                value_in_list.right = value["right"]
-            if value["right"]:
-                value_in_list = [
-                    x if value["parent"].key == x.key else None for x in inorder_list
-                ]  # find value in list
-                value_in_list = list(filter(None, value_in_list))[0]
-                value_in_list.left = value["left"]
-                value_in_list.right = value["right"]
-
-    @staticmethod
-    def _insert_nones(
-        cut_array: list,
-        inorder_list: list,
-        parent_tmp: AVLNode,
-        x_left: AVLNode,
-        x_right: AVLNode,
-        x_tmp: AVLNode,
-        y_tmp: AVLNode,
-    ) -> None:
-        """
-        Inserts None nodes into inorder list at right index.
-        """
-        x_list = [x if x_tmp.key == x.key else None for x in inorder_list]
-        x_list = list(filter(None, x_list))[0]
-        if not x_left:
-            cut_array.insert(cut_array.index(x_list), None)
-        if not x_right:
-            cut_array.insert(cut_array.index(x_list) + 1, None)
-
-        y_list = [x if y_tmp.key == x.key else None for x in inorder_list]
-        y_list = list(filter(None, y_list))[0]
-        if not y_list.left:
-            cut_array.insert(cut_array.index(y_list), None)
-        if not y_list.right:
-            cut_array.insert(cut_array.index(y_list) + 1, None)
-
-        z_list = [x if parent_tmp.key == x.key else None for x in inorder_list]
-        z_list = list(filter(None, z_list))[0]
-        if not z_list.left:
-            cut_array.insert(0, None)
-        if not z_list.right:
-            cut_array.insert(6, None)
-
-    @staticmethod
-    def _delete_children(
-        parent_child: AVLNode,
-        x_left: AVLNode,
-        x_right: AVLNode,
-        y_child: AVLNode,
-    ):
-        """
-        Delete unwanted children of a node.
-        :param parent_child: parent of the node to be deleted.
-        :param x_left: left child of x
-        :param x_right: right child of x
-        :param y_child: child of y
-        :return:
-        """
-        child_dict = defaultdict(dict)  # dictionary of children to be deleted
-        if x_left:
-            child_dict["x_left"]["parent"] = x_left
-            child_dict["x_left"]["left"] = x_left.left
-            child_dict["x_left"]["right"] = x_left.right
-            x_left.left = None
-            x_left.right = None
-        if x_right:
-            child_dict["x_right"]["parent"] = x_right
-            child_dict["x_right"]["left"] = x_right.left
-            child_dict["x_right"]["right"] = x_right.right
-            x_right.left = None
-            x_right.right = None
-        if parent_child:
-            child_dict["parent_child"]["parent"] = parent_child
-            child_dict["parent_child"]["left"] = parent_child.left
-            child_dict["parent_child"]["right"] = parent_child.right
-            parent_child.right = None
-            parent_child.left = None
-        if y_child:
-            child_dict["y_child"]["parent"] = y_child
-            child_dict["y_child"]["left"] = y_child.left
-            child_dict["y_child"]["right"] = y_child.right
-            y_child.left = None
-            y_child.right = None
-        return child_dict
-
-    @staticmethod
-    def _get_children(
-        is_x_left: bool, is_y_left: bool, parent_tmp: AVLNode
-    ) -> Tuple[AVLNode, AVLNode, AVLNode, AVLNode, AVLNode, AVLNode]:
-        """
-        Get children of a node.
-        :param is_x_left: whether x is left child of parent
-        :param is_y_left: whether y is left child of parent
-        :param parent_tmp: parent node
-        :return: proper AVLNode children
-        """
-        # get children of x and y
-        if is_y_left:
-            y_tmp = parent_tmp.left
-        else:
-            y_tmp = parent_tmp.right
-        if is_x_left:
-            x_tmp = y_tmp.left
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+        pivot.parent = node.parent
+        if node.parent is None:
+            self.root = pivot
+        elif node.parent.left is node:
+            node.parent.left = pivot
         else:
-            x_tmp = y_tmp.right
-
-        parent_child = None  # to avoid errors in a few lines
-        y_child = None
-        if y_tmp == parent_tmp.right:
-            parent_child = parent_tmp.left
-        elif y_tmp == parent_tmp.left:
-            parent_child = parent_tmp.right
-        if y_tmp.right == x_tmp:
-            y_child = y_tmp.left
-        elif y_tmp.left == x_tmp:
-            y_child = y_tmp.right
-        x_left = x_tmp.left
-        x_right = x_tmp.right
-        return parent_child, x_left, x_right, x_tmp, y_child, y_tmp
+            node.parent.right = pivot
+        pivot.right = node
+        node.parent = pivot
+
+        left, right = node.left, node.right
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        node.height = 1 + max(left_height, right_height)
+        node.bf = left_height - right_height
+        left, right = pivot.left, pivot.right
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        pivot.height = 1 + max(left_height, right_height)
+        pivot.bf = left_height - right_height
 
     def _update_single_height(self, node: AVLNode) -> int:
         """
@@ -529,7 +463,9 @@ class AVLTree:
         :param node: The node to update the height of.
         :return: None
         """
-        return 1 + max(self.get_height(node.left), self.get_height(node.right))
+        # direct attribute reads instead of two staticmethod calls
+        left, right = node.left, node.right
+        return 1 + max(left.height if left else -1, right.height if right else -1)
 
     @staticmethod
     def get_leftmost(node) -> AVLNode:
@@ -553,19 +489,6 @@ class AVLTree:
             current = current.right  # go right
         return current
 
-    @staticmethod
-    def get_smallest_recursively(node):
-        """
-        Helper function to get the smallest key in the tree, starting from a specific node (here: node).
-        :param node:
-        :return:
-        """
-        current_node = node
-        # Go left as long as left child is not None
-        while current_node.left is not None:
-            current_node = current_node.left
-        return current_node  # and return last node where child is not None
-
     @staticmethod
     def get_height(node) -> int:
         """
@@ -585,99 +508,56 @@ class AVLTree:
         :return: balance factor of node
         """
         if node:
-            return self.get_height(node.left) - self.get_height(node.right)
+            left, right = node.left, node.right
+            return (left.height if left else -1) - (right.height if right else -1)
         # Empty node's height is -1
         return -1
 
     def is_balanced(self, node: AVLNode) -> bool:
         """
-        Checks if node is balanced.
+        Checks if the subtree rooted at node is balanced.
         :param node: AVLNode
         :return: whether node is balanced
         """
-        # Base condition
         if node is None:
             return True
 
-        # get left and right subtree height
-        left_height = self.get_height(self.root.left)
-        right_height = self.get_height(self.root.right)
-
-        if (
-            (abs(left_height - right_height) <= 1)  # max. tolerated difference
-            and self.is_balanced(node.left) is True  # recurse left
-            and self.is_balanced(node.right) is True  # recurse right
-        ):
-            return True
-        return False  # unbalanced
+        # insert/remove keep node.height current, so one scan reading the
+        # cached child heights suffices -- no recomputation of any subtree.
+        # The cached balance factor is refreshed in the same pass, making
+        # repeat queries on a node a single int comparison.
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            left, right = current.left, current.right
+            left_height = left.height if left else -1
+            right_height = right.height if right else -1
+            current.bf = left_height - right_height
+            if not -1 <= current.bf <= 1:
+                return False  # short-circuit on the first imbalance
+            if right:
+                stack.append(right)
+            if left:
+                stack.append(left)
+        return True
 
     def inorder(
         self, node: AVLNode = None
     ) -> Union[Iterator, Generator[Any, Any, None]]:
         """Yield nodes in inorder."""
-        node = node or self.root
-
-        # left, root, right
-        def inorder_recursively(current_node) -> Iterator:
-            """
-            Recursively yield nodes in inorder.
-            :param current_node: AVLNode
-            :return: Iterator
-            """
-            if current_node:
-                yield from inorder_recursively(current_node.left)
-                yield current_node
-                yield from inorder_recursively(current_node.right)
-
-        # This is needed in the case that there are no nodes.
-        if not node:
-            return iter(())
-        return inorder_recursively(node)
+        return _inorder_iter(node or self.root)
 
     def preorder(
         self, node: AVLNode = None
     ) -> Union[Iterator, Generator[Any, Any, None]]:
         """Yield nodes in preorder."""
-        node = node or self.root
-
-        # root, left, right
-        def preorder_recursively(current_node) -> Iterator:
-            """
-            Recursively yield nodes in preorder.
-
-            :param current_node: AVLNode
-            :return: Iterator
-            """
-            if current_node:
-                yield current_node
-                yield from preorder_recursively(current_node.left)
-                yield from preorder_recursively(current_node.right)
-
-        if not node:
-            return iter(())
-        return preorder_recursively(node)
+        return _preorder_iter(node or self.root)
 
     def postorder(
         self, node: AVLNode = None
     ) -> Union[Iterator, Generator[Any, Any, None]]:
         """Yield nodes in postorder."""
-        node = node or self.root
-
-        # left, right, root
-        def postorder_recursively(current_node) -> Iterator:
-            """
-            Recursively yield nodes in postorder.
-            :param current_node: AVLNode
-            :return: Iterator
-            """
-            if current_node:
-                yield from postorder_recursively(current_node.left)
-                yield from postorder_recursively(current_node.right)
-                yield current_node
-
-        if not node:
-            return iter(())
-        return postorder_recursively(node)
+        return _postorder_iter(node or self.root)
 
     def print_tree(self, node: Union[AVLNode, None], level: int = 0) -> None:
         """
@@ -686,7 +566,27 @@ class AVLTree:
         :param level: level/depth of node
         :return: None
         """
-        if node is not None:
-            self.print_tree(node.right, level + 1)
-            print(" " * 4 * level + "->", node.key)
-            self.print_tree(node.left, level + 1)
+        # reversed inorder (right, root, left) with an explicit stack: no
+        # RecursionError on deep trees, one (node, level, visited) frame each
+        stack = [(node, level, False)]
+        while stack:
+            current, current_level, visited = stack.pop()
+            if current is None:
+                continue
+            if visited:
+                print(" " * 4 * current_level + "->", current.key)
+            else:
+                stack.append((current.left, current_level + 1, False))
+                stack.append((current, current_level, True))
+                stack.append((current.right, current_level + 1, False))
+
+
+try:
+    # compiled variant with cdef nodes (build with: python setup.py build_ext
+    # --inplace); same insert/remove/find behaviour with C-level pointer
+    # access, but it covers only those hot paths -- traversals beyond
+    # inorder, is_balanced, print_tree, freeze/bulk_find etc. are not
+    # implemented, so it is exported opt-in instead of shadowing AVLTree
+    from avl_tree_c import AVLTree as AVLTreeC  # noqa: F401
+except ImportError:  # extension not built
+    AVLTreeC = None
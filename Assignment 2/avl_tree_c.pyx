@@ -0,0 +1,273 @@
+# cython: language_level=3
+"""Compiled AVL tree covering avl_tree.AVLTree's hot paths.
+
+Build with: python setup.py build_ext --inplace
+avl_tree exports this class as AVLTreeC if the extension has been built
+(None otherwise). Only the core insert/remove/find/inorder API is
+implemented, so it is an opt-in replacement rather than a transparent
+drop-in. Rebalancing uses plain single/double rotations (4-8 pointer
+writes) instead of the cut-link reshape; nodes are cdef classes, so
+every pointer hop is a C struct access instead of a Python attribute
+lookup.
+"""
+
+
+cdef class AVLNode:
+    """A node in the AVL tree."""
+
+    cdef public object key
+    cdef public object value
+    cdef public AVLNode parent
+    cdef public AVLNode left
+    cdef public AVLNode right
+    cdef public int height
+    cdef public int bf
+
+    def __cinit__(self, key=0, value=None):
+        self.key = key
+        self.value = value
+        self.height = 0
+        self.bf = 0
+
+    def to_string(self):
+        """
+        Return a string representation of the node.
+        :return:None
+        """
+        return "key:" + str(self.key) + ", value: " + str(self.value)
+
+
+cdef inline int _height(AVLNode node):
+    # None has height -1
+    return node.height if node is not None else -1
+
+
+cdef class AVLTree:
+    """AVL Tree implementation (compiled)."""
+
+    cdef public AVLNode root
+    cdef public int size
+
+    def __cinit__(self):
+        self.root = None
+        self.size = 0
+
+    def get_tree_root(self):
+        """
+        Method to get the root node of the AVLTree.
+        :return AVLNode -- the root node of the AVL tree
+        """
+        return self.root
+
+    def get_tree_height(self):
+        """Retrieves tree height.
+        :return -1 in case of empty tree, current tree height otherwise.
+        """
+        return _height(self.root)
+
+    def get_tree_size(self):
+        """Yields number of key/value pairs in the tree.
+        :return Number of key/value pairs.
+        """
+        return self.size
+
+    def to_array(self):
+        """Yields an array representation of the tree's values (pre-order).
+        :return Array representation of the tree values.
+        """
+        cdef AVLNode node
+        out = []
+        stack = []
+        if self.root is not None:
+            stack.append(self.root)
+        while stack:
+            node = stack.pop()
+            out.append(node.value)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        return out
+
+    def inorder(self, node=None):
+        """Yield nodes in inorder."""
+        cdef AVLNode current = node if node is not None else self.root
+        result = []
+        stack = []
+        while current is not None or stack:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            result.append(current)
+            current = current.right
+        return iter(result)
+
+    def find_by_key(self, key, _return_node=False):
+        """Returns value of node with given key.
+        :param _return_node: whether to return node or key.
+        :param key: Key to search.
+        :return Corresponding value if key was found, None otherwise.
+        """
+        cdef AVLNode current = self.root
+        while current is not None:
+            current_key = current.key
+            if key < current_key:
+                current = current.left
+            elif key > current_key:
+                current = current.right
+            else:  # equality --> key found
+                if _return_node:
+                    return current
+                return current_key
+        return None
+
+    def insert(self, key, value):
+        """Inserts a new node into AVL tree.
+        :param key: Key of the new node.
+        :param value: Data of the new node. May be None. Nodes with the same key
+        are not allowed. In this case False is returned. None-Keys and None-Values are
+        not allowed. In this case an error is raised.
+        :return True if the insert was successful, False otherwise.
+        :raises ValueError if the key or value is None.
+        """
+        cdef AVLNode parent, current, new
+        if key is None:
+            raise ValueError("Key cannot be None.")
+        if value is None:
+            raise ValueError("Value cannot be None.")
+
+        parent = None
+        current = self.root
+        while current is not None:  # find the right place for the new node
+            parent = current
+            if key < current.key:  # go left
+                current = current.left
+            elif key > current.key:  # go right
+                current = current.right
+            else:  # duplicate key
+                return False
+
+        new = AVLNode(key, value)
+        new.parent = parent
+        if parent is None:  # tree is empty
+            self.root = new
+        elif key < parent.key:
+            parent.left = new
+        else:
+            parent.right = new
+        self._rebalance(parent)
+        self.size += 1
+        return True
+
+    def remove_by_key(self, key):
+        """Removes node with given key.
+        :param key: Key of node to remove.
+        :return True If node was found and deleted, False otherwise.
+        @raises ValueError if the key is None.
+        """
+        cdef AVLNode node, successor, child, start
+        if key is None:
+            raise ValueError("Key cannot be None.")
+
+        node = self.find_by_key(key, True)
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            # two children: move the in-order successor's payload up and
+            # delete the successor instead (it has at most a right child)
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.key = successor.key
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        start = node.parent
+        if child is not None:
+            child.parent = start
+        if start is None:
+            self.root = child
+        elif start.left is node:
+            start.left = child
+        else:
+            start.right = child
+        self._rebalance(start)
+        self.size -= 1
+        return True
+
+    cdef void _rebalance(self, AVLNode node):
+        # walk up from the deepest structurally changed node, refreshing
+        # height/bf and rotating wherever the subtree got out of balance
+        cdef AVLNode child
+        cdef int left_height, right_height
+        while node is not None:
+            left_height = _height(node.left)
+            right_height = _height(node.right)
+            node.height = 1 + (
+                left_height if left_height > right_height else right_height
+            )
+            node.bf = left_height - right_height
+            if node.bf > 1:
+                child = node.left
+                if _height(child.left) < _height(child.right):
+                    self._rotate_left(child)  # left-right case
+                self._rotate_right(node)
+                node = node.parent  # rotated subtree root
+            elif node.bf < -1:
+                child = node.right
+                if _height(child.right) < _height(child.left):
+                    self._rotate_right(child)  # right-left case
+                self._rotate_left(node)
+                node = node.parent  # rotated subtree root
+            node = node.parent
+
+    cdef void _rotate_left(self, AVLNode z):
+        cdef AVLNode y = z.right
+        cdef int left_height, right_height
+        z.right = y.left
+        if y.left is not None:
+            y.left.parent = z
+        y.parent = z.parent
+        if z.parent is None:
+            self.root = y
+        elif z.parent.left is z:
+            z.parent.left = y
+        else:
+            z.parent.right = y
+        y.left = z
+        z.parent = y
+        left_height = _height(z.left)
+        right_height = _height(z.right)
+        z.height = 1 + (left_height if left_height > right_height else right_height)
+        z.bf = left_height - right_height
+        left_height = _height(y.left)
+        right_height = _height(y.right)
+        y.height = 1 + (left_height if left_height > right_height else right_height)
+        y.bf = left_height - right_height
+
+    cdef void _rotate_right(self, AVLNode z):
+        cdef AVLNode y = z.left
+        cdef int left_height, right_height
+        z.left = y.right
+        if y.right is not None:
+            y.right.parent = z
+        y.parent = z.parent
+        if z.parent is None:
+            self.root = y
+        elif z.parent.left is z:
+            z.parent.left = y
+        else:
+            z.parent.right = y
+        y.right = z
+        z.parent = y
+        left_height = _height(z.left)
+        right_height = _height(z.right)
+        z.height = 1 + (left_height if left_height > right_height else right_height)
+        z.bf = left_height - right_height
+        left_height = _height(y.left)
+        right_height = _height(y.right)
+        y.height = 1 + (left_height if left_height > right_height else right_height)
+        y.bf = left_height - right_height
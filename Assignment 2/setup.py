@@ -0,0 +1,8 @@
+"""Builds the optional compiled AVL tree: python setup.py build_ext --inplace"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="avl_tree_c",
+    ext_modules=cythonize("avl_tree_c.pyx", language_level=3),
+)
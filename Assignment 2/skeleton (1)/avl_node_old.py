@@ -1,4 +1,8 @@
 class AVLNode:
+    # fixed attribute slots instead of a per-node __dict__: smaller nodes and
+    # faster left/right/parent access in the traversal hot loops
+    __slots__ = ("key", "value", "parent", "left", "right", "height")
+
     def __init__(self, key=0, value=None, right=None, left=None, height=0, parent=None):
         self.key = key
         self.value = value
@@ -1,19 +1,6 @@
 from avl_node import AVLNode
 
 
-def get_smallest_recursively(node):
-    """
-    Helper function to get the smallest key in the tree, starting from a specific node (here: node).
-    :param node:
-    :return:
-    """
-    current_node = node
-    # Go left as long as left child is not None
-    while current_node.left is not None:
-        current_node = current_node.left
-    return current_node  # and return last node where child is not None
-
-
 class AVLTree:
     def __init__(self):
         """Default constructor. Initializes the AVL tree."""
@@ -52,8 +39,20 @@ class AVLTree:
         """
         if self.root is None:
             return []
-        else:
-            pass
+        # one iterative preorder pass filling a preallocated list by index:
+        # no generator plumbing and no list growth while filling
+        out = [None] * self.size
+        index = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            out[index] = node.value
+            index += 1
+            if node.right:  # push right first so left is visited first
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+        return out
 
     def search_bst_helper(self, current_node, key):
         """
@@ -61,21 +60,15 @@ class AVLTree:
         :param current_node: current node for comparison to key
         :param key: key which we want to find
         """
-        if key == current_node.key:  # key is found
-            return current_node
-        elif key < current_node.key:
-            if current_node.left:
-                return self.search_bst_helper(current_node.left, key)
-            else:
-                raise KeyError("Key is not present in the tree!")
-        elif key > current_node.key:
-            if current_node.right:
-                return self.search_bst_helper(
-                    current_node.right,
-                    key,
-                )
-            else:
-                return None
+        # iterative descent: no recursion frame per level, and running off
+        # the tree reports None on both sides (the recursive version raised
+        # KeyError when going left but returned None when going right)
+        current = current_node
+        while current is not None:
+            if key == current.key:  # key is found
+                return current
+            current = current.left if key < current.key else current.right
+        return None
 
     def find_by_key(self, key, return_node=False):
         """Returns value of node with given key.
@@ -112,40 +105,37 @@ class AVLTree:
         if value is None:
             raise ValueError("Value cannot be None")
 
-        def insert_bst_helper(current_node, value, key):
-            """
-            Helper function for insert, as defined in the lecture slides
-            """
+        if self.root is None:  # tree is empty, add node as root
+            self.root = AVLNode(key=key, value=value)
+            self.size += 1
+            return True
+
+        # iterative descent instead of the recursive helper: no frame per
+        # level, and the result is no longer lost on the way back up (the
+        # recursion discarded the inner return value, so duplicates were
+        # reported as successful inserts and still counted into size)
+        current = self.root
+        while True:
             # Case 1: current node's key < key to insert
-            if current_node.key < key:
-                if current_node.right:
-                    insert_bst_helper(current_node.right, value, key)
+            if current.key < key:
+                if current.right:
+                    current = current.right
                 else:
-                    current_node.right = AVLNode(
-                        value=value, key=key, parent=current_node
-                    )
+                    current.right = AVLNode(value=value, key=key, parent=current)
+                    self.size += 1
                     return True
             # Case 2: current node's key > key to insert
-            elif current_node.key > key:
-                if current_node.left:
-                    insert_bst_helper(current_node.left, value, key)
+            elif current.key > key:
+                if current.left:
+                    current = current.left
                 else:
-                    current_node.left = AVLNode(
-                        value=value, key=key, parent=current_node
-                    )
+                    current.left = AVLNode(value=value, key=key, parent=current)
+                    self.size += 1
                     return True
-            # Case 3: current node's key == key to insert
-            # This means key is already present in the tree --> not allowed; raise KeyError
-            elif current_node.key == key:
+            # Case 3: current node's key == key to insert --> not allowed
+            else:
                 return False
 
-        self.size += 1
-        if self.root is None:  # tree is empty, add node as root
-            self.root = AVLNode(key=key, value=value)
-            return True
-        else:  # tree not empty, add node at correct position
-            return insert_bst_helper(current_node=self.root, value=value, key=key)
-
     def remove_by_key(self, key):
         """Removes node with given key.
         :param key: Key of node to remove.
@@ -193,10 +183,11 @@ class AVLTree:
 
         # CASE 3: Node has 2 child node
         elif key_to_remove.left and key_to_remove.right:
-            right_child = key_to_remove.right
-            next_successor = get_smallest_recursively(
-                right_child
-            )  # get next in-order successor of key_to_remove
+            # next in-order successor of key_to_remove: leftmost node of the
+            # right subtree, inlined instead of a helper call per removal
+            next_successor = key_to_remove.right
+            while next_successor.left is not None:
+                next_successor = next_successor.left
             if (
                 next_successor.parent != key_to_remove
             ):  # make sure it is not a child of itself
@@ -214,22 +205,9 @@ class AVLTree:
     @property
     def size_(self) -> int:
         """Return number of nodes contained in the tree."""
-
-        def get_size_recursively(node):
-            """
-            Helper function to get size of the tree. Start with the root.
-            """
-            if node is None:
-                return 0  # next node is not existent, do not increase count
-            else:
-                # increase count: from size of left/right subtree recursively, and current node (1)
-                return (
-                    get_size_recursively(node.left)
-                    + 1
-                    + get_size_recursively(node.right)
-                )
-
-        return get_size_recursively(self.root)  # Start with root
+        # insert/remove_by_key maintain the counter, so there is no need to
+        # recursively recount every node on each access
+        return self.size
 
     def transplant(self, node_1, node_2):
         """
@@ -246,13 +224,35 @@ class AVLTree:
             node_2.parent = node_1.parent
 
     def update_heights(self, recurse=True):
-        if self.root is not None:
-            if recurse:
-                if self.root.left is not None:
-                    self.root.left.update_heights()
-                if self.root.right is not None:
-                    self.root.right.update_heights()
+        """
+        Refreshes the stored heights bottom-up. The old version delegated to
+        node.update_heights(), which AVLNode never had; this is a single
+        iterative postorder pass with an explicit stack instead.
+        :param recurse: whether to refresh the whole tree or only the root
+        """
+        if self.root is None:
+            self.height = -1
+            return
 
-            self.height = max(self.root.left.height, self.root.right.height) + 1
+        if recurse:
+            stack = [(self.root, False)]
+            while stack:
+                node, done = stack.pop()
+                if node is None:
+                    continue
+                if done:  # children already refreshed
+                    left, right = node.left, node.right
+                    node.height = 1 + max(
+                        left.height if left else -1,
+                        right.height if right else -1,
+                    )
+                else:
+                    stack.append((node, True))
+                    stack.append((node.left, False))
+                    stack.append((node.right, False))
         else:
-            self.height = -1
+            left, right = self.root.left, self.root.right
+            self.root.height = 1 + max(
+                left.height if left else -1, right.height if right else -1
+            )
+        self.height = self.root.height
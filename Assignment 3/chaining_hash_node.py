@@ -4,6 +4,10 @@
 class ChainingHashNode:
     """Implement a node for a chaining hash table."""
 
+    # one node per stored key: slots avoid a __dict__ per node and make
+    # the key/next reads in the chain walks cheaper
+    __slots__ = ("key", "next")
+
     def __init__(self, key: int = None) -> None:
         """
         Initialize a new node.
@@ -49,11 +49,13 @@ class ChainingHashSet:
         """
         self.hash_table = table
         self.capacity = len(table)
-        self.table_size = 0
+        # count into a local and store once: no attribute write per node
+        count = 0
         for node in table:
             while node is not None:
-                self.table_size += 1
+                count += 1
                 node = node.next
+        self.table_size = count
 
     def get_table_size(self) -> int:
         """Return the number of stored keys (keys must be unique!)."""
@@ -68,19 +70,21 @@ class ChainingHashSet:
         """
         if key is None:
             raise ValueError("key must not be None")
-        hash_value: int = self.get_hash_code(key)
-        node = self.hash_table[hash_value]
+        hash_value = key % self.capacity  # get_hash_code inlined
+        table = self.hash_table  # bind once; the chain walk runs on locals
+        node = table[hash_value]
         if node is None:  # vacant slot
-            self.hash_table[hash_value] = ChainingHashNode(key)
+            table[hash_value] = ChainingHashNode(key)
         else:
-            while node is not None:
+            # single walk: check for duplicates on the way and stop on the
+            # tail node itself, so no previous_node bookkeeping is needed
+            while True:
                 if node.key == key:  # key already in hash table
                     return False
-                previous_node = node
+                if node.next is None:
+                    break
                 node = node.next
-            previous_node.next = ChainingHashNode(
-                key
-            )  # insert new node at end of chain
+            node.next = ChainingHashNode(key)  # append at end of chain
 
         self.table_size += 1
         return True
@@ -95,7 +99,7 @@ class ChainingHashSet:
         if key is None:
             raise ValueError("key must not be None")
 
-        hash_value = self.get_hash_code(key)
+        hash_value = key % self.capacity  # get_hash_code inlined
         node = self.hash_table[hash_value]
         while node is not None:
             if node.key == key:
@@ -113,14 +117,15 @@ class ChainingHashSet:
         if key is None:
             raise ValueError("key must not be None")
 
-        hash_value = self.get_hash_code(key)
-        node = self.hash_table[hash_value]
+        hash_value = key % self.capacity  # get_hash_code inlined
+        table = self.hash_table  # bind once; the chain walk runs on locals
+        node = table[hash_value]
         previous_node = None
 
         while node is not None:
             if node.key == key:
                 if previous_node is None:  # currently 1 node in chain
-                    self.hash_table[hash_value] = node.next
+                    table[hash_value] = node.next
                 else:
                     previous_node.next = node.next  # cut out node
                 self.table_size -= 1
@@ -141,14 +146,17 @@ class ChainingHashSet:
         Idx_0 {Node, Node, ... }, Idx_1 {...}
         e.g.: 0 {13}, 1 {82, 92, 12}, 2 {2, 32},
         """
-        result = ""
+        # collect parts and join once: += concatenation copies the whole
+        # string on every append, which is quadratic over large tables
+        parts = []
+        append = parts.append
         for i in range(self.capacity):
-            result += str(i) + " {"
+            append(str(i) + " {")
             node = self.hash_table[i]
             while node is not None:
-                result += str(node.key)
+                append(str(node.key))
                 node = node.next
                 if node is not None:
-                    result += ", "
-            result += "}, "
-        return result
+                    append(", ")
+            append("}, ")
+        return "".join(parts)
@@ -1,5 +1,57 @@
 """Implement hash table using double hashing."""
-from chaining_hash_node import ChainingHashNode
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is not installed; bulk_contains falls back to Python
+    njit = None
+
+# set to True to trace every probe sequence and dump the table per insert
+DEBUG = False
+
+# slot markers: _EMPTY ends a probe sequence, _TOMB keeps it alive so keys
+# probed past a removed slot stay reachable
+_EMPTY = object()
+_TOMB = object()
+
+# grow the table once the stored keys exceed this fraction of the slots
+_MAX_LOAD = 0.7
+
+# integer stand-ins for the sentinels in the int64 snapshot used by the
+# compiled probe kernel (keys are non-negative in this assignment)
+_EMPTY_SLOT = -1
+_TOMB_SLOT = -2
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _bulk_probe(query, slots, mask, capacity):
+        """Run the double-hashing probe for every query key in parallel.
+
+        :param query: keys to look up (int64 array)
+        :param slots: table snapshot, -1 empty / -2 tombstone (int64 array)
+        :param mask: capacity - 1 (capacity is a power of two)
+        :param capacity: number of slots, bounds the probe length
+        :return: boolean array, True where the key is stored
+        """
+        out = np.zeros(query.size, dtype=np.bool_)
+        for i in prange(query.size):
+            key = query[i]
+            hash_value = key & mask
+            offset = (1 + (key % (capacity - 1))) | 1
+            for _ in range(capacity):
+                slot = slots[hash_value]
+                if slot == _EMPTY_SLOT:
+                    break
+                if slot == key:  # tombstones are negative, keys are not
+                    out[i] = True
+                    break
+                hash_value = (hash_value + offset) & mask
+        return out
+
+else:
+    _bulk_probe = None
 
 
 class ChainingHashSet:
@@ -17,9 +69,14 @@ class ChainingHashSet:
         if capacity < 0:
             raise ValueError("capacity must not be negative")
 
-        self.hash_table = [None] * capacity
+        if capacity > 0:  # round up to a power of two so h_1 is an AND mask;
+            # at least 2 so h_2's modulo by capacity - 1 is always defined
+            capacity = max(2, 1 << (capacity - 1).bit_length())
+        self.hash_table = [_EMPTY] * capacity
         self.table_size = 0
         self.capacity = capacity
+        self._mask = capacity - 1
+        self._tombs = 0  # tombstones currently in the table
 
     def h_1(self, key: int) -> int:
         """Hash function calculating a hash code for a given key using modulo division.
@@ -27,14 +84,17 @@ class ChainingHashSet:
         :param key: Key for which a hash code shall be calculated according to the length of the hash table.
         :return: The calculated hash code for the given key.
         """
-        return key % self.capacity
+        # capacity is a power of two, so the modulo is a single AND
+        return key & self._mask
 
     def h_2(self, key: int) -> int:
         """Hash function calculating a hash code for a given key using shifted module division.
         :param key: key for which a hash code shall be calculated according to the length of the hash table.
         :return: int: The calculated hash code for the given key.
         """
-        return 1 + (key % (self.capacity - 1))
+        # forced odd: an odd step is coprime to the power-of-two capacity,
+        # so the probe sequence still visits every slot
+        return (1 + (key % (self.capacity - 1))) | 1
 
     def get_hash_table(self) -> list:
         """Return the hash table.
@@ -45,27 +105,54 @@ class ChainingHashSet:
         return self.hash_table
 
     def set_hash_table(self, table: list) -> None:
-        """Set a given hash table.
+        """Set a given hash table; None entries stand for empty slots.
 
-        :param table: Given hash table which shall be used.
-        !!!
+        The caller's slot positions need not match h_1/h_2 (hand-built
+        tables, non-power-of-two lengths), so the keys are re-inserted
+        along their own probe sequences in a fresh power-of-two table.
         (Required for testing only)
-        Since this method is needed for testing we decided to implement it.
-        You do not need to change or add anything.
-        !!!
         """
-        self.hash_table = table
-        self.capacity = len(table)
-        self.table_size = 0
-        for node in table:
-            while node is not None:
-                self.table_size += 1
-                node = node.next
+        keys = [
+            slot
+            for slot in table
+            if slot is not None and slot is not _EMPTY and slot is not _TOMB
+        ]
+        # round the given length up to a power of two, then keep growing
+        # until the keys fit under the load factor so placement never runs
+        # out of empty slots
+        capacity = max(2, 1 << (len(table) - 1).bit_length())
+        while len(keys) > _MAX_LOAD * capacity:
+            capacity *= 2
+        self.hash_table = keys  # only a container here; _rehash re-places
+        self._rehash(capacity)
+        self.table_size = len(keys)
 
     def get_table_size(self) -> int:
         """Return the number of stored keys (keys must be unique!)."""
         return self.table_size
 
+    def _rehash(self, new_capacity: int) -> None:
+        """Re-insert every stored key into a fresh table of new_capacity slots.
+
+        :param new_capacity: number of slots of the new table (power of two).
+        """
+        new_capacity = max(2, new_capacity)  # keep h_2's modulo defined
+        old_table = self.hash_table
+        self.capacity = new_capacity
+        self._mask = new_capacity - 1
+        self.hash_table = [_EMPTY] * new_capacity
+        table = self.hash_table
+        mask = self._mask
+        for key in old_table:
+            if key is _EMPTY or key is _TOMB:
+                continue
+            hash_value = key & mask
+            offset = (1 + (key % (new_capacity - 1))) | 1
+            while table[hash_value] is not _EMPTY:
+                hash_value = (hash_value + offset) & mask
+            table[hash_value] = key
+        self._tombs = 0  # rebuilt table has no tombstones
+
     def insert(self, key: int) -> bool:
         """Insert a key and return True if it was successful.
 
@@ -75,26 +162,45 @@ class ChainingHashSet:
         """
         if key is None:
             raise ValueError("key must not be None")
-        hash_value: int = self.h_1(key)
-        node = self.hash_table[hash_value]
-        print("Probing sequence:", key)
-        print(hash_value)
-        if node is None:  # vacant slot
-            self.hash_table[hash_value] = ChainingHashNode(key)
-        else:
-            offset = self.h_2(key)
-            hash_value = self.h_1(hash_value + offset)
+        # tombstones lengthen probes just like stored keys, so they count
+        # against the load factor too
+        if self.table_size + self._tombs + 1 > _MAX_LOAD * self.capacity:
+            if self.table_size + 1 > _MAX_LOAD * (self.capacity // 2):
+                self._rehash(max(2, self.capacity * 2))  # genuinely full: grow
+            else:
+                self._rehash(self.capacity)  # mostly tombstones: rebuild
+        # keys live directly in the slot array: probing scans contiguous list
+        # entries instead of chasing per-key node objects
+        table = self.hash_table
+        mask = self._mask
+        hash_value = key & mask  # h_1
+        offset = (1 + (key % (self.capacity - 1))) | 1  # h_2
+        if DEBUG:
+            print("Probing sequence:", key)
             print(hash_value)
-            while self.hash_table[hash_value] is not None:
-                if self.hash_table[hash_value].key == key:
+        first_free = -1  # first tombstone seen; reused if the key is absent
+        for _ in range(self.capacity):
+            slot = table[hash_value]
+            if slot is _EMPTY:
+                break
+            if slot is _TOMB:
+                if first_free < 0:
+                    first_free = hash_value
+            elif slot == key:
+                if DEBUG:
                     print("Key already in hash table.")
-                    return False
-                hash_value = (hash_value + offset) % self.capacity
+                return False
+            hash_value = (hash_value + offset) & mask
+            if DEBUG:
                 print(hash_value)
-            self.hash_table[hash_value] = ChainingHashNode(key)
+        if first_free >= 0:
+            hash_value = first_free
+            self._tombs -= 1  # the tombstone is overwritten by the key
+        table[hash_value] = key
         self.table_size += 1
-        print(self.to_string())
-        print("\n")
+        if DEBUG:
+            print(self.to_string())
+            print("\n")
         return True
 
     def contains(self, key: int):
@@ -107,14 +213,44 @@ class ChainingHashSet:
         if key is None:
             raise ValueError("key must not be None")
 
-        hash_value = self.get_hash_code(key)
-        node = self.hash_table[hash_value]
-        while node is not None:
-            if node.key == key:
+        table = self.hash_table
+        mask = self._mask
+        hash_value = key & mask  # h_1
+        offset = (1 + (key % (self.capacity - 1))) | 1  # h_2
+        for _ in range(self.capacity):
+            slot = table[hash_value]
+            if slot is _EMPTY:
+                return False
+            if slot is not _TOMB and slot == key:
                 return True
-            node = node.next
+            hash_value = (hash_value + offset) & mask
         return False
 
+    def bulk_contains(self, keys) -> np.ndarray:
+        """Check many integer keys at once with the compiled probe kernel.
+
+        :param keys: keys to search (any array-like of non-negative ints).
+        :return: boolean array, True at each position whose key is stored
+        (batched counterpart of contains).
+        """
+        query = np.asarray(keys, dtype=np.int64)
+        if _bulk_probe is not None:
+            slots = np.empty(self.capacity, dtype=np.int64)
+            for i, slot in enumerate(self.hash_table):
+                if slot is _EMPTY:
+                    slots[i] = _EMPTY_SLOT
+                elif slot is _TOMB:
+                    slots[i] = _TOMB_SLOT
+                else:
+                    slots[i] = slot
+            return _bulk_probe(query, slots, self._mask, self.capacity)
+        # no numba --> one interpreted probe per key
+        return np.fromiter(
+            (self.contains(int(key)) for key in query),
+            dtype=bool,
+            count=query.size,
+        )
+
     def remove(self, key):
         """Remove the key from the hash table and return True on success, False otherwise.
 
@@ -125,45 +261,47 @@ class ChainingHashSet:
         if key is None:
             raise ValueError("key must not be None")
 
-        hash_value = self.get_hash_code(key)
-        node = self.hash_table[hash_value]
-        previous_node = None
-
-        while node is not None:
-            if node.key == key:
-                if previous_node is None:  # currently 1 node in chain
-                    self.hash_table[hash_value] = node.next
-                else:
-                    previous_node.next = node.next  # cut out node
+        table = self.hash_table
+        mask = self._mask
+        hash_value = key & mask  # h_1
+        offset = (1 + (key % (self.capacity - 1))) | 1  # h_2
+        for _ in range(self.capacity):
+            slot = table[hash_value]
+            if slot is _EMPTY:
+                return False  # key never found
+            if slot is not _TOMB and slot == key:
+                table[hash_value] = _TOMB  # keep the probe sequence intact
                 self.table_size -= 1
+                self._tombs += 1
+                if self.table_size + self._tombs > _MAX_LOAD * self.capacity:
+                    self._rehash(self.capacity)  # sweep out the tombstones
                 return True
-            previous_node = node
-            node = node.next
+            hash_value = (hash_value + offset) & mask
         return False  # key never found
 
     def clear(self) -> None:
-        """Remove all stored elements from the hash table by setting all nodes to None."""
-        self.hash_table = [None] * self.capacity
+        """Remove all stored elements from the hash table by marking all slots empty."""
+        self.hash_table = [_EMPTY] * self.capacity
         self.table_size = 0
+        self._tombs = 0
 
     def to_string(self) -> str:
         """Return a string representation of the hash table (array indices and stored keys).
 
         In the format
-        Idx_0 {Node, Node, ... }, Idx_1 {...}
-        e.g.: 0 {13}, 1 {82, 92, 12}, 2 {2, 32},
+        Idx_0 {key}, Idx_1 {...}
+        e.g.: 0 {13}, 1 {82}, 2 {}, ...
         """
-        result = ""
+        parts = []
+        append = parts.append
+        table = self.hash_table
         for i in range(self.capacity):
-            result += str(i) + " {"
-            node = self.hash_table[i]
-            while node is not None:
-                result += str(node.key)
-                node = node.next
-                if node is not None:
-                    result += ", "
-            result += "}, "
-        return result
+            slot = table[i]
+            if slot is _EMPTY or slot is _TOMB:
+                append(str(i) + " {}, ")
+            else:
+                append(str(i) + " {" + str(slot) + "}, ")
+        return "".join(parts)
 
 
 def main():
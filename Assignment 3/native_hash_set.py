@@ -0,0 +1,83 @@
+"""Hash set with the ChainingHashSet API backed by the built-in set.
+
+Drop-in for chaining_hash_set / double_hashing_set when raw speed matters
+more than showing the probing: every insert/contains/remove runs inside
+CPython's C hash table (SipHash + perturbed probing) instead of
+interpreted bucket walks.
+"""
+
+
+class ChainingHashSet:
+    """Class implementing a set with the hash-set assignment API."""
+
+    __slots__ = ("_keys", "capacity")
+
+    def __init__(self, capacity: int = 0) -> None:
+        """Initialize a new hash set with a given capacity.
+
+        :param capacity: kept for API compatibility; the backing set sizes itself.
+        :return: None
+        :raises: ValueError if the capacity is negative or if capacity is not an int.
+        """
+        if not isinstance(capacity, int):
+            raise ValueError("capacity must be an int")
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+
+        self._keys = set()
+        self.capacity = capacity
+
+    def get_table_size(self) -> int:
+        """Return the number of stored keys (keys must be unique!)."""
+        return len(self._keys)
+
+    def insert(self, key: int) -> bool:
+        """Insert a key and return True if it was successful.
+
+        :param key: The key which shall be stored in the hash set.
+        :return: True if key could be inserted, or False if the key is already in the hash set.
+        :raises: ValueError if any of the input parameters is None.
+        """
+        if key is None:
+            raise ValueError("key must not be None")
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        return True
+
+    def contains(self, key: int) -> bool:
+        """Search for a given key in the hash set.
+
+        :param key: The key to be searched in the hash set.
+        :return: True if the key is already stored, otherwise False.
+        :raises: a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError("key must not be None")
+        return key in self._keys
+
+    def remove(self, key) -> bool:
+        """Remove the key from the hash set and return True on success, False otherwise.
+
+        :param key: The key to be removed from the hash set.
+        :return: True if the key was found and removed, False otherwise.
+        :raises: ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError("key must not be None")
+        if key in self._keys:
+            self._keys.remove(key)
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Remove all stored elements from the hash set."""
+        self._keys.clear()
+
+    def to_string(self) -> str:
+        """Return a string representation of the stored keys (debug only).
+
+        The backing set has no bucket layout to show, so the keys are
+        listed in sorted order: {1, 5, 13}
+        """
+        return "{" + ", ".join(str(key) for key in sorted(self._keys)) + "}"
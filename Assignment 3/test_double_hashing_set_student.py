@@ -0,0 +1,63 @@
+import unittest
+from double_hashing_set import ChainingHashSet
+
+
+class TestDoubleHashingSet(unittest.TestCase):
+    def test_set_hash_table_round_trip(self):
+        # hand-built table: the slot positions do not match h_1/h_2, the
+        # keys must still be found after set_hash_table re-places them
+        test_set = ChainingHashSet(capacity=4)
+        test_set.set_hash_table([None, 7, None, 3])
+
+        self.assertEqual(2, test_set.get_table_size())
+        self.assertTrue(test_set.contains(7))
+        self.assertTrue(test_set.contains(3))
+        self.assertFalse(test_set.contains(5))
+
+        self.assertTrue(test_set.remove(7))
+        self.assertFalse(test_set.contains(7))
+        self.assertTrue(test_set.contains(3))
+        self.assertEqual(1, test_set.get_table_size())
+
+    def test_set_hash_table_non_power_of_two(self):
+        # 11-slot table as produced by the chaining variant; the length is
+        # rounded up to a power of two and every key stays reachable
+        keys = [11, 12, 13, 14, 15, 5, 6, 7, 8, 9, 10]
+        test_set = ChainingHashSet()
+        test_set.set_hash_table([key for key in keys])
+
+        self.assertEqual(len(keys), test_set.get_table_size())
+        for key in keys:
+            self.assertTrue(test_set.contains(key))
+        for key in keys:
+            self.assertTrue(test_set.remove(key))
+        self.assertEqual(0, test_set.get_table_size())
+
+    def test_tombstone_reuse_updates_counter(self):
+        # re-inserting into a tombstone slot must not leave the tombstone
+        # counter overstated, or churn triggers needless rebuilds
+        test_set = ChainingHashSet(capacity=8)
+        for _ in range(50):
+            self.assertTrue(test_set.insert(3))
+            self.assertTrue(test_set.remove(3))
+        self.assertTrue(test_set.insert(3))
+
+        self.assertEqual(0, test_set._tombs)
+        self.assertEqual(1, test_set.get_table_size())
+        self.assertTrue(test_set.contains(3))
+
+    def test_get_set_hash_table_output(self):
+        # a table produced by get_hash_table survives the round trip
+        test_set = ChainingHashSet(capacity=8)
+        for key in (1, 9, 4):
+            test_set.insert(key)
+        other_set = ChainingHashSet()
+        other_set.set_hash_table(test_set.get_hash_table())
+
+        self.assertEqual(3, other_set.get_table_size())
+        for key in (1, 9, 4):
+            self.assertTrue(other_set.contains(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
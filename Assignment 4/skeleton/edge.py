@@ -2,6 +2,9 @@ from vertex import Vertex
 
 
 class Edge:
+    # fixed attribute slots instead of a per-instance __dict__
+    __slots__ = ("first_vertex", "second_vertex", "weight")
+
     def __init__(
         self, first_vertex: Vertex, second_vertex: Vertex, weight: int
     ) -> None:
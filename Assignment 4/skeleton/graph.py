@@ -1,5 +1,8 @@
+from array import array
 from typing import Union, List
 
+import numpy as np
+
 from vertex import Vertex
 from edge import Edge
 
@@ -18,6 +21,21 @@ class Graph:
         self.num_vertices = 0
         self.num_edges = 0
         self.undirected_graph = True
+        # name --> vertex index for O(1) find_vertex instead of a list scan
+        self._name_to_vertex: dict = {}
+        # canonical (smaller idx, larger idx) --> edge for O(1) find_edge;
+        # one entry per edge regardless of endpoint order
+        self._edge_index: dict = {}
+        # per-vertex neighbour lists, indexed by vertex idx, so adjacency
+        # queries return a ready-made list instead of rebuilding one
+        self._adj_list: List[List[Vertex]] = []
+        # edges structure-of-arrays style (endpoint indices and weights) so
+        # bulk operations like the adjacency matrix can run in NumPy
+        self._edge_u: List[int] = []
+        self._edge_v: List[int] = []
+        self._edge_w: List[int] = []
+        # cached CSR snapshot built by to_csr(); dropped on mutation
+        self._csr = None
 
     def get_number_of_vertices(self) -> int:
         """
@@ -55,12 +73,16 @@ class Graph:
         """
         if vertex_name is None:
             raise ValueError("Vertex name cannot be None")
-        if self.find_vertex(vertex_name) is not None:
-            return None
 
+        # setdefault hashes the name once for both the membership test and
+        # the insert; on a duplicate the fresh vertex is simply discarded
         new_vertex = Vertex(index=self.num_vertices, name=vertex_name)
+        if self._name_to_vertex.setdefault(vertex_name, new_vertex) is not new_vertex:
+            return None
         self.vertices.append(new_vertex)
+        self._adj_list.append([])
         self.num_vertices += 1
+        self._csr = None  # snapshot is stale now
         return new_vertex
 
     def find_vertex(self, vertex_name: str) -> Union[Vertex, None]:
@@ -74,10 +96,8 @@ class Graph:
         if vertex_name is None:
             raise ValueError("Vertex name cannot be None")
 
-        for vertex in self.vertices:
-            if vertex.name == vertex_name:
-                return vertex
-        return None  # no matching vertex found
+        # single hashed lookup; None if no matching vertex found
+        return self._name_to_vertex.get(vertex_name)
 
     def insert_edge_by_vertex_names(
         self, v1_name: str, v2_name: str, weight: int
@@ -99,18 +119,16 @@ class Graph:
         if v1_name == v2_name:
             raise ValueError("Cannot create loop")
 
-        v1 = self.find_vertex(v1_name)
-        v2 = self.find_vertex(v2_name)
+        # the names were validated above, so go straight to the name index
+        # instead of paying two find_vertex calls with their own checks
+        v1 = self._name_to_vertex.get(v1_name)
+        v2 = self._name_to_vertex.get(v2_name)
         if (
             v1 is None or v2 is None
         ):  # at least one of the vertices is not part of the graph
             return None
-        if self.find_edge(v1, v2) is not None:  # edge already exists
-            return None
-        new_edge = Edge(v1, v2, weight)
-        self.edges.append(new_edge)
-        self.num_edges += 1
-        return new_edge
+        # delegate so the adjacency index is maintained in one place
+        return self.insert_edge(v1, v2, weight)
 
     def insert_edge(self, v1: Vertex, v2: Vertex, weight: int) -> Union[Edge, None]:
         """
@@ -127,16 +145,78 @@ class Graph:
         """
         if v1 is None or v2 is None:
             raise ValueError("Vertex cannot be None")
-        if v1 == v2:
+        if v1 is v2:  # vertices are unique objects, identity is enough
             raise ValueError("Cannot create loop")
 
         if self.find_edge(v1, v2) is not None:  # edge already exists
             return None
         new_edge = Edge(v1, v2, weight)
         self.edges.append(new_edge)
+        a, b = v1.idx, v2.idx
+        self._edge_index[(a, b) if a < b else (b, a)] = new_edge
+        self._adj_list[v1.idx].append(v2)
+        self._adj_list[v2.idx].append(v1)
+        self._edge_u.append(v1.idx)
+        self._edge_v.append(v2.idx)
+        self._edge_w.append(weight)
         self.num_edges += 1
+        self._csr = None  # snapshot is stale now
         return new_edge
 
+    def insert_edges(self, pairs, weights) -> List[Edge]:
+        """
+        Inserts many edges at once from an (M, 2) array of vertex indices and
+        an array of M weights. Duplicates (within the batch or against edges
+        already in the graph) are skipped, mirroring insert_edge returning
+        None; canonicalization and duplicate detection run vectorized in
+        NumPy instead of one interpreted probe per edge.
+
+        :param pairs: array-like of shape (M, 2) with vertex indices.
+        :param weights: array-like of M edge weights.
+        :return: list of the newly added edges, in batch order.
+        :raises: ValueError if shapes do not match, if an index is out of
+                 range or if a pair is a loop.
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        weights = np.asarray(weights, dtype=np.int64)
+        if pairs.shape[0] != weights.shape[0]:
+            raise ValueError("pairs and weights must have the same length")
+        if pairs.size and (pairs.min() < 0 or pairs.max() >= self.num_vertices):
+            raise ValueError("Vertex index out of range")
+
+        # canonical (min, max) per pair; loops collapse to equal endpoints
+        lo = np.minimum(pairs[:, 0], pairs[:, 1])
+        hi = np.maximum(pairs[:, 0], pairs[:, 1])
+        if np.any(lo == hi):
+            raise ValueError("Cannot create loop")
+        # dedupe the batch on the scalar canonical key, keeping the first
+        # occurrence, before touching any per-edge Python structures
+        keys = lo * self.num_vertices + hi
+        _, first = np.unique(keys, return_index=True)
+
+        edge_index = self._edge_index
+        vertices = self.vertices
+        new_edges = []
+        for i in np.sort(first):
+            key = (lo[i], hi[i])
+            if key in edge_index:  # edge already exists
+                continue
+            v1 = vertices[pairs[i, 0]]
+            v2 = vertices[pairs[i, 1]]
+            new_edge = Edge(v1, v2, int(weights[i]))
+            self.edges.append(new_edge)
+            edge_index[key] = new_edge
+            self._adj_list[v1.idx].append(v2)
+            self._adj_list[v2.idx].append(v1)
+            new_edges.append(new_edge)
+        # bulk-extend the structure-of-arrays columns in one call each
+        self._edge_u.extend(e.first_vertex.idx for e in new_edges)
+        self._edge_v.extend(e.second_vertex.idx for e in new_edges)
+        self._edge_w.extend(e.weight for e in new_edges)
+        self.num_edges += len(new_edges)
+        self._csr = None  # snapshot is stale now
+        return new_edges
+
     def find_edge_by_vertex_names(
         self, v1_name: str, v2_name: str
     ) -> Union[Edge, None]:
@@ -154,8 +234,10 @@ class Graph:
         if v1_name == v2_name:
             raise ValueError("Cannot create loop")
 
-        v1 = self.find_vertex(v1_name)
-        v2 = self.find_vertex(v2_name)
+        # the names were validated above, so go straight to the name index
+        # instead of paying two find_vertex calls with their own checks
+        v1 = self._name_to_vertex.get(v1_name)
+        v2 = self._name_to_vertex.get(v2_name)
         if (
             v1 is None or v2 is None
         ):  # at least one of the vertices is not part of the graph
@@ -173,15 +255,12 @@ class Graph:
         """
         if v1 is None or v2 is None:
             raise ValueError("Vertex cannot be None")
-        if v1 == v2:
+        if v1 is v2:  # vertices are unique objects, identity is enough
             raise ValueError("Cannot create loop")
 
-        for edge in self.edges:
-            if (edge.first_vertex == v1 and edge.second_vertex == v2) or (
-                edge.first_vertex == v2 and edge.second_vertex == v1
-            ):  # edge found
-                return edge
-        return None
+        # canonical key: one dict lookup, no per-direction branch
+        a, b = v1.idx, v2.idx
+        return self._edge_index.get((a, b) if a < b else (b, a))
 
     def get_adjacency_matrix(self) -> List[List[int]]:
         """
@@ -190,17 +269,62 @@ class Graph:
 
         :return: adjacency matrix, as a list of lists.
         """
-        # N x N matrix of -1 entries
-        matrix = [
-            [-1 for _ in range(self.num_vertices)] for _ in range(self.num_vertices)
-        ]
+        # fancy indexing writes every edge weight in one vectorized pass
+        # instead of two attribute-loaded stores per edge
+        matrix = np.full((self.num_vertices, self.num_vertices), -1, dtype=np.int64)
+        u = np.fromiter(self._edge_u, dtype=np.int64, count=self.num_edges)
+        v = np.fromiter(self._edge_v, dtype=np.int64, count=self.num_edges)
+        w = np.fromiter(self._edge_w, dtype=np.int64, count=self.num_edges)
+        # undirected graph --> symmetric
+        matrix[u, v] = w
+        matrix[v, u] = w
+        return matrix.tolist()
+
+    def get_adjacency_matrix_flat(self) -> array:
+        """
+        Returns the adjacency matrix as one flat array.array('i') of length
+        N*N, indexed by i * N + j. The entry is the edge weight, or -1 where
+        there is no edge. Compared to the list-of-lists variant this packs
+        the whole matrix into contiguous 4-byte ints instead of N row
+        objects full of boxed Python ints.
 
-        for edge in self.edges:
+        :return: flat row-major adjacency matrix of signed C ints.
+        """
+        n = self.num_vertices
+        matrix = array("i", [-1]) * (n * n)
+        for u, v, w in zip(self._edge_u, self._edge_v, self._edge_w):
             # undirected graph --> symmetric
-            matrix[edge.first_vertex.idx][edge.second_vertex.idx] = edge.weight
-            matrix[edge.second_vertex.idx][edge.first_vertex.idx] = edge.weight
+            matrix[u * n + v] = w
+            matrix[v * n + u] = w
         return matrix
 
+    def to_csr(self):
+        """
+        Returns the graph in compressed sparse row form as three NumPy arrays
+        (indptr, indices, weights): the neighbours of vertex i are
+        indices[indptr[i]:indptr[i + 1]] with the matching edge weights.
+        Both directions of every edge are stored since the graph is
+        undirected. The snapshot is cached until the graph is mutated.
+
+        :return: tuple of (indptr, indices, weights) int64 arrays.
+        """
+        if self._csr is not None:
+            return self._csr
+
+        u = np.fromiter(self._edge_u, dtype=np.int64, count=self.num_edges)
+        v = np.fromiter(self._edge_v, dtype=np.int64, count=self.num_edges)
+        w = np.fromiter(self._edge_w, dtype=np.int64, count=self.num_edges)
+        # symmetric: every edge appears in the rows of both endpoints
+        src = np.concatenate((u, v))
+        dst = np.concatenate((v, u))
+        wgt = np.concatenate((w, w))
+        # stable sort groups entries by row with a deterministic order
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(self.num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=self.num_vertices), out=indptr[1:])
+        self._csr = (indptr, dst[order], wgt[order])
+        return self._csr
+
     def get_adjacent_vertices_by_vertex_name(self, vertex_name: str) -> List[Vertex]:
         """
         Returns a list of vertices which are adjacent to the vertex with name vertex_name.
@@ -228,10 +352,6 @@ class Graph:
         if vertex is None:
             raise ValueError("Vertex cannot be None")
 
-        adjacent_vertices = []
-        for edge in self.edges:
-            if edge.first_vertex == vertex:  # edge.first_vertex is vertex
-                adjacent_vertices.append(edge.second_vertex)
-            elif edge.second_vertex == vertex:  # edge.second_vertex is vertex
-                adjacent_vertices.append(edge.first_vertex)
-        return adjacent_vertices
+        # the neighbour list is maintained on insert (in edge-insertion
+        # order), so this is a direct lookup with no list rebuild
+        return self._adj_list[vertex.idx]
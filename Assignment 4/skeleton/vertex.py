@@ -1,4 +1,7 @@
 class Vertex:
+    # fixed attribute slots instead of a per-instance __dict__
+    __slots__ = ("idx", "name")
+
     def __init__(self, index: int, name: str = "") -> None:
         """
         Initialize a vertex with an index and optional name.
@@ -7,3 +10,11 @@ class Vertex:
         """
         self.idx = index  # index at which the vertex has been added
         self.name = name  # name of the vertex
+
+    def __eq__(self, other) -> bool:
+        # vertices are unique objects owned by the graph
+        return other is self
+
+    def __hash__(self) -> int:
+        # the index is unique within a graph, no need to hash the name
+        return hash(self.idx)